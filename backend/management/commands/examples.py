@@ -8,6 +8,13 @@ import requests
 import sys
 import re
 
+# Patterns used by normalize_query, compiled once at module load.
+IRI_HASH_REGEX = re.compile(r'(<[^>]+)#')
+COMMENT_REGEX = re.compile(r'#.*\n', flags=re.MULTILINE)
+IRI_ESCAPED_HASH_REGEX = re.compile(r'(<[^>]+)%23')
+WHITESPACE_REGEX = re.compile(r'\s+')
+DOT_BEFORE_BRACE_REGEX = re.compile(r'\s*\.\s*}')
+
 # Command to get the example queries from the particular backend, with one line
 # per query, in the format:
 # 
@@ -48,11 +55,13 @@ class Command(BaseCommand):
         # self.log()
         # self.log(f"Keys of Example table: {Example._meta.fields}")
         result = []
-        for example in Example.objects.all():
-            if example.backend.pk == backend.pk:
-                query_name = example.name
-                query_string = self.normalize_query(example.query)
-                result.append(f"{query_name}\t{query_string}")
+        # Let the database do the filtering (instead of fetching the backend of
+        # each example with a separate query) and only load the two columns we
+        # actually need.
+        for query_name, query in Example.objects.filter(
+                backend=backend).values_list("name", "query"):
+            query_string = self.normalize_query(query)
+            result.append(f"{query_name}\t{query_string}")
         self.log(f"Returning {len(result)} example queries for backend \"{slug}\"")
         return "\n".join(result) + "\n"
 
@@ -60,15 +69,15 @@ class Command(BaseCommand):
     # static/js/helper.js).
     def normalize_query(self, query):
         # Replace # in IRIs by %23.
-        query = re.sub(r'(<[^>]+)#', r'\1%23', query)
+        query = IRI_HASH_REGEX.sub(r'\1%23', query)
         # Remove comments.
-        query = re.sub(r'#.*\n', ' ', query, flags=re.MULTILINE)
+        query = COMMENT_REGEX.sub(' ', query)
         # Re-replace %23 in IRIs by #.
-        query = re.sub(r'(<[^>]+)%23', r'\1#', query)
+        query = IRI_ESCAPED_HASH_REGEX.sub(r'\1#', query)
         # Replace all sequences of whitespace by a single space.
-        query = re.sub(r'\s+', ' ', query)
+        query = WHITESPACE_REGEX.sub(' ', query)
         # Remove . before }.
-        query = re.sub(r'\s*\.\s*}', ' }', query)
+        query = DOT_BEFORE_BRACE_REGEX.sub(' }', query)
         # Remove any trailing whitespace.
         query = query.strip()
 
@@ -16,6 +16,9 @@ class Command(BaseCommand):
 
     def __init__(self, *args, **kwargs):
         self._logs = []
+        # Reuse one HTTP session (and hence the TCP connection to QLever) for
+        # all requests of a warmup run.
+        self._session = requests.Session()
         super().__init__( *args, **kwargs)
 
     class Targets(TextChoices):
@@ -76,6 +79,11 @@ class Command(BaseCommand):
             )
 
         self.backend = backend
+        # Both only depend on the backend, so compute them once per run instead
+        # of for every (recursive) query substitution.
+        self._placeholders = backend.getWarmupAndAcPlaceholders()
+        self._prefixString = "\n".join(
+            [f"PREFIX {prefixName}: <{prefix}>" for prefixName, prefix in backend.availablePrefixes.items()])
 
         if target == self.Targets.CLEAR_AND_PIN:
             self.clear()
@@ -99,7 +107,7 @@ class Command(BaseCommand):
         headers = { "Accept": "application/qlever-results+json" }
         # print(f"PYTHON VERSION: {sys.version}", file=sys.stderr)
         try:
-            response = requests.post(self.backend.baseUrl, data=params, headers=headers)
+            response = self._session.post(self.backend.baseUrl, data=params, headers=headers)
             # response = requests.get(self.backend.baseUrl, params=params, headers=headers)
             response.raise_for_status()
             return response
@@ -183,7 +191,7 @@ class Command(BaseCommand):
 
     def _buildQuery(self, completionQuery):
         substitutionFinished = True
-        for placeholder, replacement in self.backend.getWarmupAndAcPlaceholders().items():
+        for placeholder, replacement in self._placeholders.items():
             newQuery = completionQuery.replace(f"%{placeholder}%", replacement)
             if (newQuery != completionQuery):
                 substitutionFinished = False
@@ -200,9 +208,7 @@ class Command(BaseCommand):
             return self._buildQuery(completionQuery)
 
     def _getPrefixString(self):
-        prefixString = "\n".join(
-            [f"PREFIX {prefixName}: <{prefix}>" for prefixName, prefix in self.backend.availablePrefixes.items()])
-        return prefixString
+        return self._prefixString
 
     def _pinQuery(self, query):
         params = { "query": query, "pinresult": "true", "send": "10" }
@@ -213,4 +219,6 @@ class Command(BaseCommand):
                 self.log(f"ERROR in processing query: {jsonData['exception']}",
                         format="red")
             else:
-                self.log(f"Result size: {jsonData['resultsize']:,}", format="blue")
+                self.log(f"Result size: {jsonData['resultsize']:,}"
+                         f", time: {response.elapsed.total_seconds():.2f}s",
+                         format="blue")
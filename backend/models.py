@@ -4,6 +4,12 @@ import re
 from django.db import models
 import datetime
 
+# Matches "<predicate> <replacement>" at the start of each line (leading
+# whitespace allowed), so that all lines can be parsed in a single scan.
+PREDICATE_REPLACEMENT_REGEX = re.compile(
+    r"^[^\S\n]*(\S+)[^\S\n]+(\S+)", re.MULTILINE)
+PREFIX_DECLARATION_REGEX = re.compile(r"prefix\s+(\S+):\s+(\S+)", re.IGNORECASE)
+
 
 class Backend(models.Model):
     MODES = ((3, '4. Mixed mode'),
@@ -387,12 +393,7 @@ class Backend(models.Model):
         return json.dumps(data)
 
     def replacePredicatesList(self):
-        data = {}
-        for line in self.replacePredicates.split("\n"):
-            match = re.search("([\S]+)[\s]+([\S]+)", line)
-            if match:
-                predicate, replacement = match.groups()
-                data[predicate] = replacement
+        data = dict(PREDICATE_REPLACEMENT_REGEX.findall(self.replacePredicates))
         return json.dumps(data)
 
     def getWarmupAndAcPlaceholders(self):
@@ -415,7 +416,7 @@ class Backend(models.Model):
     @property
     def availablePrefixes(self):
         prefixes = {}
-        for match in re.findall(r"prefix\s+(\S+):\s+(\S+)", self.suggestedPrefixes, re.IGNORECASE):
+        for match in PREFIX_DECLARATION_REGEX.findall(self.suggestedPrefixes):
             prefixes[match[0]] = match[1].strip('<>')
         return prefixes
 
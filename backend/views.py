@@ -40,10 +40,8 @@ def index(request, backend=None, short=None):
 
     # if a backend is given try to activate it
     if backend:
-        for availableBackend in Backend.objects.all():
-            if availableBackend.slugify() == backend:
-                activeBackend = availableBackend
-                break
+        # slugify() just returns the slug, so let the database find the backend
+        activeBackend = Backend.objects.filter(slug=backend).first()
 
         if activeBackend == None:
             return redirect('/')